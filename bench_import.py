@@ -0,0 +1,58 @@
+import subprocess
+import sys
+import time
+from typing import Final, List, Optional
+
+Modules: Final[List[str]] = [
+    "exercise_1.analytic",
+    "exercise_1.mesh",
+    "exercise_1.mssolution",
+    "exercise_1.coax_cable",
+    "exercise_1.batch",
+]
+"""The modules that get imported by headless batch runs."""
+
+Heavy: Final[List[str]] = ["gmsh", "matplotlib"]
+"""The modules that must only be loaded by meshing or plotting functions."""
+
+
+def import_time(statement: str, repeat: int = 5) -> Optional[float]:
+    """The best wall time of a fresh interpreter executing the given import statement.
+
+    :param statement: The python statement to execute.
+    :param repeat: The number of interpreter starts.
+    :return: The time in seconds, or None if the statement failed, e.g. as gmsh can't be loaded.
+    """
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        if subprocess.run([sys.executable, "-c", statement], capture_output=True).returncode != 0:
+            return None
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def loaded_heavy(module: str) -> List[str]:
+    """The heavy modules that are loaded by importing the given module."""
+    check = f"import sys, {module}; print(','.join(m for m in {Heavy} if m in sys.modules))"
+    out = subprocess.run([sys.executable, "-c", check], check=True, capture_output=True, text=True).stdout
+    return [m for m in out.strip().split(",") if m]
+
+
+def _ms(t: Optional[float]) -> str:
+    """Formats the time in milliseconds."""
+    return "unavailable" if t is None else f"{t * 1e3:8.1f} ms"
+
+
+if __name__ == '__main__':
+    print(f"{'interpreter':<24} {_ms(import_time('pass'))}")
+    print(f"{'eager gmsh/matplotlib':<24} {_ms(import_time('import numpy, scipy.sparse, gmsh, matplotlib.pyplot'))}")
+
+    failed = False
+    for module in Modules:
+        heavy = loaded_heavy(module)
+        failed |= len(heavy) > 0
+        print(f"{module:<24} {_ms(import_time(f'import {module}'))}  loads: {heavy or '-'}")
+
+    sys.exit(1 if failed else 0)
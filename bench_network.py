@@ -0,0 +1,43 @@
+import resource
+import sys
+import time
+from typing import Final
+
+import numpy as np
+
+from exercise_1.network import CrossSection, Section, abcd
+
+NumSections: Final[int] = 1000
+"""The number of cascaded sections."""
+
+NumFrequencies: Final[int] = 10 ** 4
+"""The number of frequencies."""
+
+MaxTime: Final[float] = 0.5
+"""The maximum runtime of the analysis in seconds."""
+
+Repeat: Final[int] = 5
+"""The number of timed runs. The best one is compared against 'MaxTime'."""
+
+
+def harness(num_sections: int = NumSections, seed: int = 0):
+    """A harness of sections with two cross-sections and distinct lengths."""
+    rng = np.random.default_rng(seed)
+    cross_sections = [CrossSection(R=1.4e-3, L=2.5e-7, C=1.1e-10), CrossSection(R=5.6e-3, L=3.1e-7, C=0.9e-10)]
+    return [Section(cross_sections[i % 2], length) for i, length in enumerate(rng.uniform(0.01, 1, num_sections))]
+
+
+if __name__ == '__main__':
+    sections = harness()
+    f = np.logspace(0, 8, NumFrequencies)
+
+    times = []
+    for _ in range(Repeat):
+        start = time.perf_counter()
+        abcd(sections, f)
+        times.append(time.perf_counter() - start)
+    runtime = min(times)
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    print(f"{NumSections} sections, {NumFrequencies} frequencies: {runtime:.3f} s, peak RSS {rss:.0f} MB")
+    sys.exit(0 if runtime < MaxTime else 1)
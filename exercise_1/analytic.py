@@ -1,7 +1,6 @@
 import math
 from typing import Final
 
-import matplotlib.pylab as plt
 import numpy as np
 import numpy.typing
 from numpy import pi
@@ -13,45 +12,53 @@ from util.array import arg_as_array
 
 
 @arg_as_array()
-def H_phi(r: ArrayLike):
+def H_phi(r: ArrayLike, r_wire: float = r1):
     """
     Analytic solution for the phi-component of the magnetic field of the coaxial cable.
 
     :param r: Radius values.
+    :param r_wire: The radius of the wire.
     :return: Values of the magnetic field strength H.
     """
 
     @arg_as_array()
     def H_phi_i(r: ArrayLike):
-        return I / (2 * np.pi * r1 ** 2) * r
+        return I / (2 * np.pi * r_wire ** 2) * r
 
     @arg_as_array()
     def H_phi_a(r: ArrayLike):
         return I / (2 * np.pi * r)
 
-    condition = r < r1
-    return condition * H_phi_i(r) + (~condition) * H_phi_a(r)
+    condition = r < r_wire
+    with np.errstate(divide='ignore'):  # The outer solution is singular at r=0
+        return np.where(condition, H_phi_i(r), H_phi_a(r))
 
 
 @arg_as_array()
-def A_z(r: ArrayLike):
+def A_z(r: ArrayLike, r_wire: float = r1, r_shell: float = r2, mu_wire: float = mu_w, mu_shell: float = mu_s):
     """
     Analytic solution for the z-component of magnetic vector potential of the coaxial cable.
 
     :param r: Radius values.
+    :param r_wire: The radius of the wire.
+    :param r_shell: The outer radius of the shell.
+    :param mu_wire: The permeability of the wire.
+    :param mu_shell: The permeability of the shell.
     :return: Values of the magnetic vector potential A.
     """
 
     @arg_as_array()
     def A_z_i(r: ArrayLike):
-        return -I / (2 * np.pi) * (mu_w / 2 * (r ** 2 - r1 ** 2) / r1 ** 2 + mu_s * np.log(r1 / r2))
+        return -I / (2 * np.pi) * (mu_wire / 2 * (r ** 2 - r_wire ** 2) / r_wire ** 2
+                                   + mu_shell * np.log(r_wire / r_shell))
 
     @arg_as_array()
     def A_z_a(r: ArrayLike):
-        return -mu_s * I / (2 * np.pi) * np.log(r / r2)
+        return -mu_shell * I / (2 * np.pi) * np.log(r / r_shell)
 
-    condition = r < r1
-    return condition * A_z_i(r) + (~condition) * A_z_a(r)
+    condition = r < r_wire
+    with np.errstate(divide='ignore'):  # The outer solution is singular at r=0
+        return np.where(condition, A_z_i(r), A_z_a(r))
 
 
 def W_mag() -> float:
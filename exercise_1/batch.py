@@ -0,0 +1,241 @@
+import argparse
+import json
+import os
+import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field, fields, asdict, replace
+from typing import Dict, Final, List, Optional, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+from exercise_1.constants import r1, r2, mu_w, mu_s, eps_s, sig_cu, WIRE, SHELL
+from exercise_1.material import Copper, Insulator
+from exercise_1.reordering import Orderings
+from util.gmsh import DefaultOptions
+
+if TYPE_CHECKING:
+    from exercise_1.mssolution import MSSolution
+
+Outputs: Final[Tuple[str, ...]] = ("W_mag", "L", "C", "R", "Z_char", "A_z", "B", "store")
+"""The quantities a job can request. 'store' saves the field solution as a 'store.SolutionStore'."""
+
+EXIT_OK: Final[int] = 0
+"""Exit code if all jobs succeeded."""
+
+EXIT_FAILED: Final[int] = 1
+"""Exit code if at least one job failed while solving."""
+
+EXIT_CONFIG: Final[int] = 2
+"""Exit code if a job description is invalid. Also used by argparse for usage errors."""
+
+
+@dataclass
+class Job:
+    """A job description for a single run of the coaxial cable pipeline.
+
+    geometry: The radii 'r1' and 'r2' of the wire and the shell.
+    materials: The permeabilities 'mu_w', 'mu_s', permittivity 'eps_s' and wire conductivity 'sig_w'.
+    mesh_size: The gmsh mesh size factor.
+    ordering: The DOF ordering of the solver. See 'reordering.Orderings'.
+    outputs: The requested quantities. See 'Outputs'.
+    frequencies: The frequencies for the 'Z_char' sweep.
+    """
+
+    name: str
+    geometry: Dict[str, float] = field(default_factory=lambda: dict(r1=r1, r2=r2))
+    materials: Dict[str, float] = field(default_factory=lambda: dict(mu_w=mu_w, mu_s=mu_s, eps_s=eps_s, sig_w=sig_cu))
+    mesh_size: float = DefaultOptions["Mesh.MeshSizeFactor"]
+    ordering: Optional[str] = None
+    outputs: List[str] = field(default_factory=lambda: ["W_mag", "L", "C"])
+    frequencies: List[float] = field(default_factory=list)
+
+    @staticmethod
+    def of(config: Dict):
+        """Creates a job from a parsed job description.
+
+        The frequencies are either a list or a dict with the 'start', 'stop' and 'num' arguments of 'np.logspace'.
+
+        :raises ValueError: If the description contains unknown keys, values of wrong type or invalid values.
+        """
+
+        if not isinstance(config, dict):
+            raise ValueError(f"A job description must be a dict, not {config!r}.")
+        unknown = set(config) - {f.name for f in fields(Job)}
+        if unknown:
+            raise ValueError(f"Unknown job keys {sorted(unknown)}.")
+        if not _valid_name(config.get("name")):
+            raise ValueError(f"A job needs a 'name' that is a valid file name, not {config.get('name')!r}.")
+        for key in ("geometry", "materials"):
+            if not isinstance(config.get(key, {}), dict):
+                raise ValueError(f"The {key} of job '{config['name']}' must be a dict.")
+
+        job = Job(**{k: v for k, v in config.items() if k not in ("geometry", "materials")})
+        job.geometry.update(config.get("geometry", {}))
+        job.materials.update(config.get("materials", {}))
+
+        if isinstance(job.frequencies, dict):
+            try:
+                job.frequencies = np.logspace(**job.frequencies).tolist()
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"Invalid frequencies {job.frequencies} of job '{job.name}': {e}")
+        if set(job.geometry) != {"r1", "r2"} or not _positive(*job.geometry.values()) \
+                or job.geometry["r1"] >= job.geometry["r2"]:
+            raise ValueError(f"Invalid geometry {job.geometry} of job '{job.name}'.")
+        if set(job.materials) != set(Job(name="").materials) or not _positive(*job.materials.values()):
+            raise ValueError(f"Invalid materials {job.materials} of job '{job.name}'.")
+        if not _positive(job.mesh_size):
+            raise ValueError(f"Invalid mesh size {job.mesh_size!r} of job '{job.name}'.")
+        if job.ordering is not None and job.ordering not in Orderings:
+            raise ValueError(f"Unknown ordering {job.ordering!r} of job '{job.name}'. Must be one of {Orderings}.")
+        if not isinstance(job.outputs, list) or not all(isinstance(o, str) for o in job.outputs):
+            raise ValueError(f"The outputs of job '{job.name}' must be a list of strings.")
+        if not set(job.outputs) <= set(Outputs):
+            raise ValueError(f"Unknown outputs {sorted(set(job.outputs) - set(Outputs))}. Must be in {Outputs}.")
+        if not isinstance(job.frequencies, list) or not _positive(*job.frequencies):
+            raise ValueError(f"The frequencies of job '{job.name}' must be positive numbers.")
+        if "Z_char" in job.outputs and not job.frequencies:
+            raise ValueError(f"Output 'Z_char' of job '{job.name}' needs frequencies.")
+        return job
+
+
+def _valid_name(name) -> bool:
+    """Whether the name is a non-empty string usable as a file name in the output directory."""
+    return isinstance(name, str) and name not in ("", ".", "..") and not any(sep in name for sep in "/\\")
+
+
+def _positive(*values) -> bool:
+    """Whether all values are positive numbers."""
+    return all(isinstance(v, (int, float)) and not isinstance(v, bool) and v > 0 for v in values)
+
+
+def load(*paths: str) -> List[Job]:
+    """Loads the jobs of JSON job descriptions. Each file contains a single job or a list of jobs.
+
+    :raises ValueError: If a job description is invalid or several jobs have the same name.
+    """
+
+    jobs = []
+    for path in paths:
+        with open(path) as file:
+            config = json.load(file)
+        jobs += [Job.of(c) for c in (config if isinstance(config, list) else [config])]
+
+    names = [job.name for job in jobs]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Duplicate job names {duplicates}. The results would overwrite each other.")
+    return jobs
+
+
+def run(job: Job) -> Tuple[Dict[str, float], Dict[str, np.ndarray], "MSSolution"]:
+    """Runs the pipeline for the given job without any GUI.
+
+    :return: The scalar results, the array results and the solution.
+    """
+
+    import gmsh
+
+    from exercise_1.coax_cable import cable
+    from exercise_1.geometry import Geo
+    from exercise_1.mesh import Mesh
+    from exercise_1.mssolution import MSSolution
+
+    try:
+        cable(r_wire=job.geometry["r1"], r_shell=job.geometry["r2"],
+              gmsh_options={**DefaultOptions, "General.Terminal": 0, "Mesh.MeshSizeFactor": job.mesh_size})
+        mesh = Mesh.create()
+    finally:
+        gmsh.finalize()
+
+    geo = Geo(mesh, r_wire=job.geometry["r1"], r_shell=job.geometry["r2"], materials={
+        WIRE: replace(Copper, mu=job.materials["mu_w"], sigma=job.materials["sig_w"]),
+        SHELL: replace(Insulator, mu=job.materials["mu_s"], eps=job.materials["eps_s"])
+    })
+    solution = MSSolution(mesh, geo, ordering=job.ordering)
+    a = solution.solve()
+
+    scalars = dict(num_node=mesh.num_node, num_elems=mesh.num_elems)
+    arrays = {}
+    if "W_mag" in job.outputs:
+        scalars["W_mag"] = float(0.5 * np.dot(a, solution.knu * a))
+    if "L" in job.outputs:
+        scalars["L"] = float(solution.L)
+    if "C" in job.outputs:
+        scalars["C"] = solution.C
+    if "R" in job.outputs:
+        scalars["R"] = solution.R
+    if "Z_char" in job.outputs:
+        arrays["f"] = np.asarray(job.frequencies)
+        arrays["Z_char"] = solution.Z_char(arrays["f"])
+    if "A_z" in job.outputs:
+        arrays["A_z"] = a
+    if "B" in job.outputs:
+        arrays["B"] = solution.b
+    return scalars, arrays, solution
+
+
+def write(job: Job, scalars: Dict[str, float], arrays: Dict[str, np.ndarray], out: str, solution=None):
+    """Writes the results of the job to '<out>/<name>.json' and, if there are array results, '<out>/<name>.npz'.
+    If requested, the solution is saved to the store '<out>/<name>.store'.
+    """
+    os.makedirs(out, exist_ok=True)
+    if "store" in job.outputs:
+        from exercise_1.store import SolutionStore
+        SolutionStore.save(os.path.join(out, f"{job.name}.store"), solution, mesh=job.name, scalars=scalars)
+    with open(os.path.join(out, f"{job.name}.json"), "w") as file:
+        json.dump(dict(job=asdict(job), results=scalars), file, indent=2)
+    if arrays:
+        np.savez(os.path.join(out, f"{job.name}.npz"), **arrays)
+
+
+def execute(job: Job, out: str) -> Optional[str]:
+    """Runs the job and writes its results.
+
+    :return: None if the job succeeded, else the error message.
+    """
+
+    try:
+        scalars, arrays, solution = run(job)
+        write(job, scalars, arrays, out, solution)
+        return None
+    except Exception:
+        return traceback.format_exc()
+
+
+def main(argv: List[str] = None) -> int:
+    """The command-line entry point. Returns the exit code."""
+
+    parser = argparse.ArgumentParser(description="Headless batch runs of the coaxial cable pipeline.")
+    parser.add_argument("configs", nargs="+", help="JSON job descriptions. Each contains a job or a list of jobs.")
+    parser.add_argument("-o", "--out", default="results", help="The output directory.")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="The number of jobs to run concurrently.")
+    args = parser.parse_args(argv)
+
+    try:
+        jobs = load(*args.configs)
+    except (OSError, ValueError, TypeError) as e:
+        print(f"Invalid job description: {e}", file=sys.stderr)
+        return EXIT_CONFIG
+
+    if args.jobs > 1:
+        # Separate processes per job, as gmsh keeps a global state
+        try:
+            with ProcessPoolExecutor(args.jobs, max_tasks_per_child=1) as pool:
+                errors = list(pool.map(execute, jobs, [args.out] * len(jobs)))
+        except BrokenProcessPool as e:
+            # A worker died without returning, e.g. killed by a crash in gmsh or running out of memory
+            print(f"A job process terminated abruptly: {e}", file=sys.stderr)
+            return EXIT_FAILED
+    else:
+        errors = [execute(job, args.out) for job in jobs]
+
+    for job, error in zip(jobs, errors):
+        if error is not None:
+            print(f"Job '{job.name}' failed:\n{error}", file=sys.stderr)
+    return EXIT_OK if all(e is None for e in errors) else EXIT_FAILED
+
+
+if __name__ == '__main__':
+    sys.exit(main())
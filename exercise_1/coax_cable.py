@@ -1,30 +1,30 @@
 from typing import Tuple, List
 
-import gmsh
 import numpy as np
-from matplotlib import pyplot as plt
 
 from exercise_1.analytic import H_phi
 from exercise_1.constants import r1, r2, WIRE, GND, SHELL
 from exercise_1.mesh import Mesh
 from util.gmsh import model
 
-gm = gmsh.model.occ
-msh = gmsh.model.mesh
-
 
 @model(name="coaxial_cable", dim=2, show_gui=False)
-def cable(tags: Tuple[int, int, int] = (WIRE, SHELL, GND)) -> Tuple[int, int, int]:
+def cable(tags: Tuple[int, int, int] = (WIRE, SHELL, GND), r_wire: float = r1, r_shell: float = r2) \
+        -> Tuple[int, int, int]:
     """
     Creates a 2D cross-section of the coaxial_cable.
 
     :param tags: The group tags for the wire, shell and ground.
+    :param r_wire: The radius of the wire.
+    :param r_shell: The outer radius of the shell.
     :return: The group tags.
     """
+    import gmsh
+    gm = gmsh.model.occ
 
     # Inner and outer cable cross-section
-    circ1 = gm.add_circle(0, 0, 0, r1)
-    circ2 = gm.add_circle(0, 0, 0, r2)
+    circ1 = gm.add_circle(0, 0, 0, r_wire)
+    circ2 = gm.add_circle(0, 0, 0, r_shell)
     loop1 = gm.add_curve_loop([circ1])
     loop2 = gm.add_curve_loop([circ2])
 
@@ -46,6 +46,7 @@ def cable(tags: Tuple[int, int, int] = (WIRE, SHELL, GND)) -> Tuple[int, int, in
 
 def plot_h_field():
     """Plots the h field of the coaxial cable in the range 0 to r2."""
+    from matplotlib import pyplot as plt
 
     r = np.linspace(0, r2, 50)
     plt.plot(r, H_phi(r), 'r--')
@@ -56,6 +57,8 @@ def plot_geometry():
     """
     Plots the cable geometry and visualizes the physical groups.
     """
+    from matplotlib import pyplot as plt
+
     wire, shell, gnd = cable()
     mesh = Mesh.create()
     wire = mesh.nodes_in_group(wire)
@@ -82,6 +85,8 @@ def node_coords(dim=-1, tag=-1) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     Returns the coordinates of the nodes of the mesh.
     :return: The x,y,z coordinates.
     """
+    import gmsh
+    msh = gmsh.model.mesh
 
     node_tags, nodes = msh.get_nodes_for_physical_group(dim, tag)
     num_nodes = len(node_tags)
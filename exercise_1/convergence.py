@@ -0,0 +1,178 @@
+import argparse
+import json
+import sys
+import time
+from dataclasses import dataclass, asdict
+from typing import Dict, Final, List, Optional, Sequence, Tuple
+
+import numpy as np
+import numpy.linalg as la
+
+from exercise_1.analytic import A_z, H_phi, W_mag
+from exercise_1.batch import Job, run
+from exercise_1.constants import l_z
+from exercise_1.mssolution import MSSolution
+
+MeshSizes: Final[Tuple[float, ...]] = (1.6, 0.8, 0.4, 0.2, 0.1)
+"""The default ladder of gmsh mesh size factors."""
+
+MinRates: Final[Dict[str, float]] = {"A_z": 1.5, "B": 0.8, "energy": 0.8}
+"""The minimum convergence rates of the errors with respect to the mesh size h."""
+
+Tolerance: Final[float] = 1e-2
+"""The maximum relative errors 'err_W' and 'err_knu' of the magnetic energy on the finest mesh."""
+
+_a, _b = 0.445948490915965, 0.091576213509771
+QuadPoints: Final[np.ndarray] = np.array([
+    [_a, _a, 1 - 2 * _a], [_a, 1 - 2 * _a, _a], [1 - 2 * _a, _a, _a],
+    [_b, _b, 1 - 2 * _b], [_b, 1 - 2 * _b, _b], [1 - 2 * _b, _b, _b],
+])
+"""The barycentric coordinates of the 6-point triangle quadrature of degree 4. Matrix of size (Q,3)."""
+
+QuadWeights: Final[np.ndarray] = np.array([0.223381589678011] * 3 + [0.109951743655322] * 3)
+"""The weights of the triangle quadrature. They sum up to 1."""
+
+
+@dataclass
+class Level:
+    """The errors and runtime of one mesh of the ladder.
+
+    err_A_z: The relative L2 error of the vector potential.
+    err_B: The relative L2 error of the flux density.
+    err_energy: The relative energy norm error of the flux density.
+    err_W: The relative error of the magnetic energy.
+    err_knu: The relative error of the energy of the analytic solution in the Knu matrix.
+    time: The runtime of meshing and solving in seconds.
+    """
+
+    mesh_size: float
+    h: float
+    num_node: int
+    err_A_z: float
+    err_B: float
+    err_energy: float
+    err_W: float
+    err_knu: float
+    time: float
+
+
+def quad_points(solution: MSSolution) -> np.ndarray:
+    """The coordinates of the quadrature points of all elements. Array of size (E,Q,2)."""
+    mesh = solution.mesh
+    return np.einsum('qk,ekd->eqd', QuadPoints, mesh.node_coords[mesh.elems])
+
+
+def integrate(solution: MSSolution, values: np.ndarray) -> float:
+    """Integrates the values at the quadrature points over the cross-section.
+
+    :param values: The values at the quadrature points. Matrix of size (E,Q).
+    """
+    return float(np.sum(solution.mesh.elem_areas * (values @ QuadWeights)))
+
+
+def errors(solution: MSSolution) -> Tuple[float, float, float]:
+    """The relative L2 errors of A_z and B and the relative energy error of B against the analytic solution.
+
+    :param solution: The solved magneto-static problem.
+    """
+
+    x = quad_points(solution)
+    r = la.norm(x, axis=2)
+    nu = solution.geo.reluctivity[:, None]
+
+    # Vector potential per length l_z. Linear interpolation of the nodal values
+    a_h = QuadPoints @ (solution.a[solution.mesh.elems] / l_z).T
+    a = A_z(r)
+    err_a = integrate(solution, (a_h.T - a) ** 2) / integrate(solution, a ** 2)
+
+    # Flux density B = mu H_phi e_phi
+    b_h = solution.b[:, None, :]
+    b = (H_phi(r) / (nu * r))[..., None] * np.stack([-x[..., 1], x[..., 0]], axis=-1)
+    diff = np.sum((b_h - b) ** 2, axis=2)
+    norm = np.sum(b ** 2, axis=2)
+    err_b = integrate(solution, diff) / integrate(solution, norm)
+    err_e = integrate(solution, nu * diff) / integrate(solution, nu * norm)
+
+    return float(np.sqrt(err_a)), float(np.sqrt(err_b)), float(np.sqrt(err_e))
+
+
+def level(mesh_size: float, ordering: Optional[str] = None) -> Level:
+    """Runs the pipeline for the given mesh size factor and computes the errors."""
+
+    start = time.perf_counter()
+    _, _, solution = run(Job(name=f"h{mesh_size}", mesh_size=mesh_size, ordering=ordering, outputs=[]))
+    return level_of(solution, mesh_size, time.perf_counter() - start)
+
+
+def level_of(solution: MSSolution, mesh_size: float, runtime: float = 0) -> Level:
+    """Computes the errors of a solved magneto-static problem.
+
+    :param solution: The solution. 'solve' must have been called.
+    :param mesh_size: The mesh size factor of the mesh.
+    :param runtime: The runtime of meshing and solving in seconds.
+    """
+
+    mesh = solution.mesh
+    w_ana = W_mag()
+    w_h = 0.5 * solution.a @ (solution.knu @ solution.a)
+    a_ana = A_z(solution.geo.r) * l_z
+    w_knu = 0.5 * a_ana @ (solution.knu @ a_ana)  # Energy of the analytic solution in the Knu matrix
+    h = float(np.mean(la.norm(np.diff(mesh.node_coords[mesh.edge_to_node], axis=1)[:, 0], axis=1)))
+
+    err_a, err_b, err_e = errors(solution)
+    return Level(mesh_size, h, mesh.num_node, err_a, err_b, err_e,
+                 abs(w_h - w_ana) / w_ana, abs(w_knu - w_ana) / w_ana, runtime)
+
+
+def rate(levels: Sequence[Level], err: str) -> float:
+    """The convergence rate of the given error. Slope of a least-squares fit of log(err) over log(h)."""
+    h = np.log([lvl.h for lvl in levels])
+    e = np.log([getattr(lvl, f"err_{err}") for lvl in levels])
+    return float(np.polyfit(h, e, 1)[0])
+
+
+def check(levels: Sequence[Level], min_rates: Dict[str, float] = None, tol: float = Tolerance) -> Dict:
+    """Fits the convergence rates and checks them and the finest energy errors 'err_W' and 'err_knu'
+    against the thresholds.
+
+    :return: A report with the levels, rates and the pass/fail result.
+    """
+
+    if min_rates is None:
+        min_rates = MinRates
+    rates = {err: rate(levels, err) for err in min_rates}
+    finest = min(levels, key=lambda lvl: lvl.h)
+    passed = all(rates[err] >= min_rates[err] for err in min_rates) and max(finest.err_W, finest.err_knu) <= tol
+    return dict(levels=[asdict(lvl) for lvl in levels], rates=rates, min_rates=min_rates, tol=tol, passed=passed)
+
+
+def main(argv: List[str] = None) -> int:
+    """The command-line entry point. Returns 0 if the accuracy thresholds are met, else 1."""
+
+    parser = argparse.ArgumentParser(description="Convergence regression against the analytic coaxial cable.")
+    parser.add_argument("--sizes", type=float, nargs="+", default=MeshSizes, help="The mesh size factors.")
+    parser.add_argument("--ordering", default=None, help="The DOF ordering of the solver.")
+    parser.add_argument("--tol", type=float, default=Tolerance, help="The tolerance of the finest energy errors.")
+    parser.add_argument("-o", "--out", default=None, help="A JSON file for the report.")
+    args = parser.parse_args(argv)
+
+    levels = [level(size, args.ordering) for size in args.sizes]
+    report = check(levels, tol=args.tol)
+
+    print(f"{'size':>6} {'h':>10} {'nodes':>8} {'A_z':>10} {'B':>10} {'energy':>10} {'W_mag':>10} {'Knu':>10} "
+          f"{'time':>8}")
+    for lvl in levels:
+        print(f"{lvl.mesh_size:6.2f} {lvl.h:10.3e} {lvl.num_node:8d} {lvl.err_A_z:10.3e} {lvl.err_B:10.3e} "
+              f"{lvl.err_energy:10.3e} {lvl.err_W:10.3e} {lvl.err_knu:10.3e} {lvl.time:8.3f}")
+    rates = report["rates"].items()
+    print("rates: " + ", ".join(f"{err} {r:.2f} (min {report['min_rates'][err]})" for err, r in rates))
+    print("PASSED" if report["passed"] else "FAILED")
+
+    if args.out is not None:
+        with open(args.out, "w") as file:
+            json.dump(report, file, indent=2)
+    return 0 if report["passed"] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
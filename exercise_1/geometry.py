@@ -1,24 +1,82 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Dict
 
 import numpy as np
 import numpy.linalg as la
 
-from exercise_1.constants import mu_s, mu_w, WIRE, SHELL
+from exercise_1.constants import r1, r2
+from exercise_1.material import Material, default_materials
 from exercise_1.mesh import Mesh
 
 
 @dataclass
 class Geo:
-    """An object for handling the geometry data."""
+    """An object for handling the geometry data.
+
+    r_wire: The radius of the wire.
+    r_shell: The outer radius of the shell.
+    materials: The materials of the physical groups. Group tag - material dict.
+    """
 
     mesh: Mesh
+    r_wire: float = r1
+    r_shell: float = r2
+    materials: Dict[int, Material] = field(default_factory=default_materials)
+    _properties: Dict[str, np.ndarray] = field(default_factory=dict, init=False, repr=False)
+
+    @cached_property
+    def groups(self) -> Dict[int, np.ndarray]:
+        """The element indices of the physical groups with a material. Computed once per mesh."""
+        return {tag: np.where(self.mesh.elem_in_group(tag))[0] for tag in self.materials}
+
+    def elem_property(self, name: str) -> np.ndarray:
+        """A cached vector with the values of the given material property for all elements.
+        Elements without material are zero.
+
+        :param name: The name of a float attribute of 'Material', e.g. 'reluctivity'.
+        """
+
+        if name not in self._properties:
+            values = np.zeros(self.mesh.num_elems)
+            for tag, material in self.materials.items():
+                values[self.groups[tag]] = getattr(material, name)
+            self._properties[name] = values
+        return self._properties[name]
+
+    def set_material(self, tag: int, material: Material):
+        """Assigns the material to the physical group. Only the entries of its elements are updated.
+        Cached property vectors are copied on write, so vectors returned before keep their values.
+        Matrices assembled from this geometry are not updated. See 'MSSolution.set_material'.
+
+        :param tag: The tag of the physical group.
+        :param material: The new material.
+        """
+
+        if tag not in self.materials:
+            self.groups[tag] = np.where(self.mesh.elem_in_group(tag))[0]
+        self.materials[tag] = material
+        for name, values in self._properties.items():
+            values = values.copy()
+            values[self.groups[tag]] = getattr(material, name)
+            self._properties[name] = values
 
     @property
     def reluctivity(self) -> np.ndarray:
         """A vector with reluctivity values."""
-        return self.mesh.elem_in_group(SHELL) / mu_s + self.mesh.elem_in_group(WIRE) / mu_w
+        return self.elem_property("reluctivity")
 
     @property
+    def permittivity(self) -> np.ndarray:
+        """A vector with permittivity values."""
+        return self.elem_property("eps")
+
+    @property
+    def conductivity(self) -> np.ndarray:
+        """A vector with conductivity values."""
+        return self.elem_property("sigma")
+
+    @cached_property
     def r(self) -> np.ndarray:
         """The radius values for all nodes of the mesh."""
         return la.norm(self.mesh.node_coords, axis=1)
@@ -6,26 +6,41 @@ from exercise_1.geometry import Geo
 from exercise_1.mesh import Mesh
 
 
+def K_laplace(mesh: Mesh, weights: np.ndarray) -> spmatrix:
+    """The stiffness matrix of the weighted Laplace operator div(w grad u) for linear triangle elements.
+
+    :param mesh: The mesh object.
+    :param weights: The material weights of the elements. Vector of size (E).
+    """
+
+    m = mesh.num_node  # Dimension of the matrix
+    _, b, c = mesh.coeffs
+    S = mesh.elem_areas
+
+    # Local 3x3 matrices of all elements. Array of size (E,3,3)
+    k = (b[:, :, None] * b[:, None, :] + c[:, :, None] * c[:, None, :]) * (weights / (4 * S))[:, None, None]
+    rows = np.repeat(mesh.elems, 3, axis=1)  # Row indices for the entries
+    cols = np.tile(mesh.elems, (1, 3))  # Column indices for the entries
+
+    return csr_matrix((k.ravel(), (rows.ravel(), cols.ravel())), shape=(m, m))
+
+
 def Knu(mesh: Mesh, geo: Geo) -> spmatrix:
     """The stiffness matrix K.
 
     :param mesh: The mesh object.
     :param geo: The geometry object.
     """
+    return K_laplace(mesh, geo.reluctivity / l_z)
 
-    n = mesh.num_elems * 9  # Amount of matrix entries
-    m = mesh.num_node  # Dimension of Knu matrix
-    knu = np.zeros(n)  # Nonzero entries of the Knu matrix
-    rows = np.zeros(n, dtype='int')  # Row indices for the entries
-    cols = np.zeros(n, dtype='int')  # Column indices for the entries
 
-    for e in range(mesh.num_elems):
-        idx = mesh.elems[e]
-        rows[9*e:9*(e+1)] = np.repeat(idx, 3)
-        cols[9*e:9*(e+1)] = np.reshape([idx, idx, idx], 9)
-        knu[9*e:9*(e+1)] = Knu_e(e, mesh, geo).flatten()
+def Keps(mesh: Mesh, geo: Geo) -> spmatrix:
+    """The electrostatic stiffness matrix K_eps of the cable with length l_z.
 
-    return csr_matrix((knu, (rows, cols)), shape=(m, m))
+    :param mesh: The mesh object.
+    :param geo: The geometry object.
+    """
+    return K_laplace(mesh, geo.permittivity * l_z)
 
 
 def Knu_e(elem: int, mesh: Mesh, geo: Geo) -> np.ndarray:
@@ -0,0 +1,55 @@
+from dataclasses import dataclass
+from typing import Dict, Final, Optional, Tuple
+
+import numpy as np
+from scipy import constants as const
+
+from exercise_1.constants import mu_w, mu_s, eps_s, sig_cu, WIRE, SHELL
+
+
+@dataclass(frozen=True)
+class Material:
+    """A material record.
+
+    mu: The permeability.
+    eps: The permittivity.
+    sigma: The conductivity.
+    bh_curve: Optional samples (B,H) of a non-linear B-H curve. Both vectors are sorted ascending.
+        Stored as tuples, so materials stay hashable and comparable.
+    """
+
+    mu: float
+    eps: float = const.epsilon_0
+    sigma: float = 0
+    bh_curve: Optional[Tuple[Tuple[float, ...], Tuple[float, ...]]] = None
+
+    def __post_init__(self):
+        if self.bh_curve is not None:
+            b_s, h_s = self.bh_curve
+            object.__setattr__(self, "bh_curve", (tuple(map(float, b_s)), tuple(map(float, h_s))))
+
+    @property
+    def reluctivity(self) -> float:
+        """The (linear) reluctivity."""
+        return 1 / self.mu
+
+    def nu(self, b: np.ndarray) -> np.ndarray:
+        """The reluctivity H/B for the given magnitudes of the flux density. Interpolated from the B-H curve."""
+        b = np.asarray(b)
+        if self.bh_curve is None:
+            return np.full(b.shape, self.reluctivity)
+        b_s, h_s = self.bh_curve
+        initial = (h_s[1] - h_s[0]) / (b_s[1] - b_s[0])  # Initial slope for B=0
+        return np.where(b > 0, np.interp(b, b_s, h_s) / np.where(b > 0, b, 1), initial)
+
+
+Copper: Final[Material] = Material(mu=mu_w, sigma=sig_cu)
+"""The copper of the wire."""
+
+Insulator: Final[Material] = Material(mu=mu_s, eps=eps_s)
+"""The insulating material of the shell."""
+
+
+def default_materials() -> Dict[int, Material]:
+    """The materials of the physical groups of the coaxial cable."""
+    return {WIRE: Copper, SHELL: Insulator}
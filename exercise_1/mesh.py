@@ -2,13 +2,10 @@ from dataclasses import dataclass
 from functools import cached_property
 from typing import List, Dict, Tuple
 
-import gmsh
 import numpy as np
 
 from util.model import Point2D
 
-msh = gmsh.model.mesh
-
 
 @dataclass
 class Mesh:
@@ -118,8 +115,7 @@ class Mesh:
         :param tag: The tag of the physical group minus 1.
         """
 
-        nodes = self.nodes_in_group(tag)
-        return np.asarray([set(e) <= set(nodes) for e in self.elems])
+        return np.all(self.node_tags_groups[self.elems, tag] > 0, axis=1)
 
     @staticmethod
     def elem_area(p_i: Point2D, p_j: Point2D, p_k: Point2D):
@@ -173,6 +169,9 @@ class Mesh:
     @staticmethod
     def create():
         """Creates an instance of a Mesh object."""
+        import gmsh
+        msh = gmsh.model.mesh
+
         node_tag, node, _ = msh.get_nodes()
         element_types, element_tags, node_tags_elements = msh.get_elements()
         groups = gmsh.model.get_physical_groups()
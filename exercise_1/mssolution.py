@@ -1,29 +1,40 @@
 from dataclasses import dataclass, field
 from functools import cached_property
+from typing import Callable, Dict, Final, Optional, Tuple
 
 import numpy as np
-import scipy.sparse.linalg as las
 from numpy import ndarray, pi, sqrt
 from scipy.sparse import spmatrix
 
-from exercise_1.analytic import C
-from exercise_1.constants import GND, l_z, I, eps_s, mu_s, sig_cu, r1, mu_w
+from exercise_1.constants import GND, WIRE, l_z, I
 from exercise_1.geometry import Geo
-from exercise_1.knu_matrix import Knu
+from exercise_1.material import Material
+from exercise_1.knu_matrix import Knu, Keps
 from exercise_1.load_vector import X
 from exercise_1.mesh import Mesh
+from exercise_1.reordering import OrderingStats, DefaultPermc, permutation, permute, factorize
 from exercise_1.solver_ms import inflate, deflate
 
 
+Dependencies: Final[Dict[str, Tuple[str, ...]]] = {
+    "mu": ("knu", "knu_dof", "ordering_stats", "knu_solver", "Q", "b", "L"),
+    "eps": ("keps", "phi", "C"),
+    "sigma": ("R",),
+}
+"""The cached quantities of 'MSSolution' that depend on a material property."""
+
+
 @dataclass
 class MSSolution:
     """An object for solving the magneto-statics problem Ka=j and calculating post-processing quantities.
 
-    TODO: Add material parameters.
+    ordering: The DOF ordering passed to 'reordering.permutation'.
+        None lets SuperLU order the columns by COLAMD. See 'reordering.Orderings' for measured fill-in.
     """
 
     mesh: Mesh
     geo: Geo
+    ordering: Optional[str] = None
     a: np.ndarray = field(init=False)
 
     def __post_init__(self):
@@ -47,8 +58,7 @@ class MSSolution:
     @cached_property
     def Q(self) -> ndarray:
         """The charge vector."""
-        A, b = deflate(self.knu, self.X, self.idx_dof)
-        x: np.ndarray = las.spsolve(A, b)
+        x = self.solve_dof(self.X)
         Q = np.zeros(self.j.shape[0])
         return inflate(Q, x, self.idx_dof)
 
@@ -62,14 +72,65 @@ class MSSolution:
         """The indices for the degrees of freedom."""
         return np.setdiff1d(self.mesh.node_tags, self.idx_dir)
 
+    @cached_property
+    def knu_dof(self) -> spmatrix:
+        """The Knu matrix deflated to the degrees of freedom."""
+        A, _ = deflate(self.knu, self.j, self.idx_dof)
+        return A
+
+    @cached_property
+    def perm(self) -> Optional[np.ndarray]:
+        """The order of the DOFs used for solving. None if SuperLU chooses the column order."""
+        if self.ordering is None:
+            return None
+        return permutation(self.knu_dof, self.ordering)
+
+    @cached_property
+    def ordering_stats(self) -> Tuple[OrderingStats, OrderingStats]:
+        """The sparsity statistics of the deflated Knu matrix without and with the DOF ordering.
+        The fill-in without ordering is the one of SuperLU's default column ordering used by the solver.
+        """
+        before = OrderingStats.of(self.knu_dof, DefaultPermc)
+        after = before if self.perm is None else OrderingStats.of(permute(self.knu_dof, self.perm))
+        return before, after
+
+    @cached_property
+    def knu_solver(self) -> Callable[[np.ndarray], np.ndarray]:
+        """The factorization of the deflated Knu matrix. Shared by all magneto-static solves."""
+        return factorize(self.knu_dof, self.perm)
+
+    def solve_dof(self, rhs: spmatrix) -> np.ndarray:
+        """Solves the deflated system for the given right hand side in the chosen DOF ordering.
+
+        :returns: The solution on the DOFs in the original node order. Vector of size (len(idx_dof)).
+        """
+        return self.knu_solver(rhs[self.idx_dof])
+
+    def set_material(self, tag: int, material: Material):
+        """Assigns the material to the physical group of the geometry.
+        Only the cached quantities depending on a changed material property are discarded.
+        If the permeability changed, the solution a is reset and 'solve' has to be called again.
+
+        :param tag: The tag of the physical group.
+        :param material: The new material.
+        """
+
+        old = self.geo.materials.get(tag)
+        self.geo.set_material(tag, material)
+        for prop, names in Dependencies.items():
+            if old is None or getattr(old, prop) != getattr(material, prop):
+                for name in names:
+                    self.__dict__.pop(name, None)
+                if prop == "mu":
+                    self.a = np.zeros(self.mesh.num_node)
+
     def solve(self) -> np.ndarray:
         """Solves the magneto-static system Ka=j.
 
         :returns: The solution for the magnetic vector potential in z-direction on the nodes. Vector of size (N).
         """
 
-        A, b = deflate(self.knu, self.j, self.idx_dof)
-        x: np.ndarray = las.spsolve(A, b)
+        x = self.solve_dof(self.j)
         return inflate(self.a, x, self.idx_dof)
 
     @cached_property
@@ -86,20 +147,44 @@ class MSSolution:
     @cached_property
     def L(self) -> float:
         """The inductance L."""
-        A, b = deflate(self.knu, self.X, self.idx_dof)
-        y: np.ndarray = las.spsolve(A, b)
-        return (self.X.T * inflate(self.a, y, self.idx_dof))[0]
+        y = self.solve_dof(self.X)
+        return (self.X.T * inflate(np.zeros(self.mesh.num_node), y, self.idx_dof))[0]
+
+    @cached_property
+    def keps(self) -> spmatrix:
+        """The Keps matrix."""
+        return Keps(self.mesh, self.geo)
+
+    @property
+    def idx_dir_es(self):
+        """The indices of dirichlet nodes for the electro-static problem. The ground and the wire nodes."""
+        return np.union1d(self.idx_dir, self.mesh.nodes_in_group(WIRE))
+
+    @property
+    def idx_dof_es(self):
+        """The indices for the degrees of freedom of the electro-static problem."""
+        return np.setdiff1d(self.mesh.node_tags, self.idx_dir_es)
+
+    @cached_property
+    def phi(self) -> np.ndarray:
+        """The electric potential for a unit voltage between wire and ground. Vector of size (N)."""
+        phi = np.zeros(self.mesh.num_node)
+        phi[self.mesh.nodes_in_group(WIRE)] = 1
+
+        A, b = deflate(self.keps, -(self.keps @ phi), self.idx_dof_es)
+        perm = None if self.ordering is None else permutation(A, self.ordering)
+        x = factorize(A, perm)(b)
+        return inflate(phi, x, self.idx_dof_es)
 
     @cached_property
     def C(self) -> float:
         """The capacitance C."""
-        return C()
-        return eps_s * mu_s / self.L * l_z**2 # TODO: Fix numerical value
+        return float(self.phi @ (self.keps @ self.phi))
 
     @cached_property
     def R(self) -> float:
         """The per-unit-length resistance R'."""
-        return 1 / (sig_cu * pi * r1**2)
+        return 1 / (self.geo.materials[WIRE].sigma * pi * self.geo.r_wire**2)
 
     def Z(self, f: float) -> float:
         """The impedance Z."""
@@ -0,0 +1,221 @@
+import json
+from dataclasses import dataclass, asdict
+from typing import Dict, Final, Sequence, Tuple
+
+import numpy as np
+from numpy import pi
+
+from exercise_1.constants import l_z
+from exercise_1.mssolution import MSSolution
+
+
+@dataclass(frozen=True)
+class CrossSection:
+    """The per-unit-length parameters of a transmission line cross-section.
+
+    R: The resistance R'.
+    L: The inductance L'.
+    C: The capacitance C'.
+    """
+
+    R: float
+    L: float
+    C: float
+
+    @staticmethod
+    def of(solution: MSSolution):
+        """The cross-section parameters of a solved cable of length l_z."""
+        return CrossSection(R=solution.R, L=solution.L / l_z, C=solution.C / l_z)
+
+    def propagation(self, f: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """The propagation constants and characteristic impedances for all frequencies.
+
+        :param f: The frequencies. Vector of size (F).
+        """
+        w = 2 * pi * np.asarray(f)
+        Z = self.R + 1j * w * self.L
+        Y = 1j * w * self.C
+        return np.sqrt(Z * Y), np.sqrt(Z / Y)
+
+
+@dataclass(frozen=True)
+class Section:
+    """A uniform transmission line section with the given cross-section and length."""
+
+    cross_section: CrossSection
+    length: float
+
+
+BlockSize: Final[int] = 1 << 16
+"""The number of section-frequency pairs whose matrices are built at once in 'abcd'. Bounds the memory."""
+
+_cache: Dict[str, CrossSection] = {}
+"""The FEM results of already computed cross-sections. Job description - cross-section dict."""
+
+
+def cross_section(job) -> CrossSection:
+    """The cross-section of the given 'batch.Job'. The FEM pipeline only runs once per cross-section.
+
+    :param job: The job description. Its name, ordering, outputs and frequencies don't change the cross-section.
+    """
+
+    from exercise_1.batch import run
+
+    desc = asdict(job)
+    ignored = ("name", "ordering", "outputs", "frequencies")
+    key = json.dumps({k: v for k, v in desc.items() if k not in ignored}, sort_keys=True)
+    if key not in _cache:
+        _, _, solution = run(job)
+        _cache[key] = CrossSection.of(solution)
+    return _cache[key]
+
+
+def abcd(sections: Sequence[Section], f: np.ndarray) -> np.ndarray:
+    """The chain (ABCD) matrix of the cascaded sections for all frequencies.
+    Maps the voltage and current (U,I) at the start of the first section to those at the end of the last section.
+
+    The cascade is reduced in the basis of the forward and backward waves. There, a section only scales the forward
+    wave by exp(-2 beta l) relative to the backward wave, and a junction of two cross-sections mixes the waves by
+    the reflection coefficient. The remaining scalar factors of all sections are collected in a single exponential.
+    The propagation is only computed once per distinct cross-section. The section matrices are built for blocks of
+    sections at once, multiplied pairwise in closed form and reduced by a tree of batched products into preallocated
+    arrays.
+
+    :param sections: The sections from start to end.
+    :param f: The frequencies. Vector of size (F).
+    :return: The chain matrices. Array of size (F,2,2).
+    """
+
+    f = np.asarray(f, dtype=float)
+    chain = np.zeros((2, 2) + f.shape, dtype=complex)
+    chain[0, 0] = chain[1, 1] = 1
+
+    if len(sections) > 0:
+        # Propagation constants and characteristic impedances of the distinct cross-sections. Matrices of size (U,F)
+        index = {}
+        for s in sections:
+            index.setdefault(s.cross_section, len(index))
+        beta, z = np.stack([cs.propagation(f) for cs in index], axis=1)
+
+        # The cross-sections of the sections and of the following sections. The last section has no junction
+        idx = np.array([index[s.cross_section] for s in sections])
+        nxt = np.r_[idx[1:], idx[-1]]
+        lengths = np.array([s.length for s in sections], dtype=float)
+
+        # Reflection coefficients and transmission factors of the junctions between two cross-sections.
+        # Arrays of size (U,U,F)
+        refl = (z[:, None] - z[None, :]) / (z[:, None] + z[None, :])
+        trans = (z[:, None] + z[None, :]) / (2 * z[:, None])
+        count = np.zeros((len(index), len(index)))
+        np.add.at(count, (idx, nxt), 1)
+        scale = np.exp(np.bincount(idx, lengths, len(index)) @ beta + np.einsum('ab,ab...->...', count, np.log(trans)))
+
+        block = min(len(sections), max(1, BlockSize // max(1, f.size)))
+        m = np.empty((2, 2, (block + 1) // 2) + f.shape, dtype=complex)
+        work = np.empty((2, 2, (block + 3) // 4) + f.shape, dtype=complex)
+        wave, prev = chain.copy(), np.empty_like(chain)
+        for start in range(0, len(sections), block):
+            k = min(block, len(sections) - start)
+            sl = slice(start, start + k)
+            pairs = _section_pairs(beta, refl, idx[sl], nxt[sl], lengths[sl], m[:, :, :(k + 1) // 2])
+            wave, prev = _mul(_reduce(pairs, work), wave, prev), wave
+
+        # Back to voltages and currents. The waves (1, 1/Z_c) and (1, -1/Z_c) of the last and first cross-section
+        one = np.ones_like(z[0])
+        z_first, z_last = z[idx[0]], z[idx[-1]]
+        first_inv = np.stack([np.stack([one, z_first]), np.stack([one, -z_first])]) / 2
+        last = np.stack([np.stack([one, one]), np.stack([1 / z_last, -1 / z_last])])
+        _mul(last, _mul(wave, first_inv, prev), chain)
+        chain *= scale
+
+    return np.moveaxis(chain, (0, 1), (-2, -1))
+
+
+def _section_pairs(beta: np.ndarray, refl: np.ndarray, idx: np.ndarray, nxt: np.ndarray, lengths: np.ndarray,
+                   out: np.ndarray) -> np.ndarray:
+    """The products G[2i+1] @ G[2i] of the wave chain matrices of consecutive sections followed by their junctions.
+    G = [[x, r], [r x, 1]], where x = exp(-2 beta l) is the propagation of the forward relative to the backward wave
+    and r the reflection coefficient. A last unpaired section is kept as is.
+
+    :param beta: The propagation constants of the distinct cross-sections. Matrix of size (U,F).
+    :param refl: The reflection coefficients of the junctions between two cross-sections. Array of size (U,U,F).
+    :param idx: The cross-section indices of the sections. Vector of size (K).
+    :param nxt: The cross-section indices of the following sections. Vector of size (K).
+    :param lengths: The lengths of the sections. Vector of size (K).
+    :param out: The matrices with the matrix axes first. Array of size (2,2,ceil(K/2),F).
+    :return: The matrices out.
+    """
+
+    x = np.multiply(beta[idx], -2 * lengths[:, None])
+    np.exp(x, out=x)
+    r = refl[idx, nxt]
+
+    n = len(idx) - len(idx) % 2
+    x1, x2, r1, r2 = x[0:n:2], x[1:n:2], r[0:n:2], r[1:n:2]
+    o = out[:, :, :n // 2]
+    np.multiply(r2, r1, out=o[0, 0])
+    o[0, 0] += x2
+    o[0, 0] *= x1
+    np.multiply(x2, r1, out=o[0, 1])
+    o[0, 1] += r2
+    np.multiply(r2, x2, out=o[1, 1])
+    np.add(o[1, 1], r1, out=o[1, 0])
+    o[1, 0] *= x1
+    o[1, 1] *= r1
+    o[1, 1] += 1
+    if n < len(idx):
+        out[0, 0, n // 2], out[0, 1, n // 2] = x[n], r[n]
+        np.multiply(r[n], x[n], out=out[1, 0, n // 2])
+        out[1, 1, n // 2] = 1
+    return out
+
+
+def _mul(p: np.ndarray, q: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """The batched products p @ q of 2x2 matrices with the matrix axes first. Arrays of size (2,2,...).
+
+    :param out: The products. Must not overlap with p or q.
+    :return: The products out.
+    """
+
+    tmp = np.empty_like(out[0, 0])
+    for i in range(2):
+        for j in range(2):
+            np.multiply(p[i, 0], q[0, j], out=out[i, j])
+            np.multiply(p[i, 1], q[1, j], out=tmp)
+            out[i, j] += tmp
+    return out
+
+
+def _reduce(m: np.ndarray, work: np.ndarray) -> np.ndarray:
+    """The product m[K-1] @ ... @ m[0] of a stack of matrices by a pairwise tree reduction.
+    The levels of the tree alternate between m and work, so both are overwritten.
+
+    :param m: The matrices with the matrix axes first. Array of size (2,2,K,F).
+    :param work: The buffer of the odd levels. Array of size (2,2,ceil(K/2),F).
+    :return: The product. Array of size (2,2,F).
+    """
+
+    a, b, size = m, work, m.shape[2]
+    while size > 1:
+        n = size - size % 2
+        _mul(a[:, :, 1:n:2], a[:, :, 0:n:2], b[:, :, :n // 2])
+        if n < size:
+            b[:, :, n // 2] = a[:, :, n]
+        a, b, size = b, a, (size + 1) // 2
+    return a[:, :, 0]
+
+
+def admittance(chain: np.ndarray) -> np.ndarray:
+    """The admittance matrices for the given chain matrices. Maps the voltages (U_0,U_l) to the currents (I_0,I_l).
+
+    :param chain: The chain matrices. Array of size (F,2,2).
+    :return: The admittance matrices. Array of size (F,2,2).
+    """
+
+    a, b = chain[..., 0, 0], chain[..., 0, 1]
+    c, d = chain[..., 1, 0], chain[..., 1, 1]
+    det = a * d - b * c
+    y = np.stack([np.stack([-a, np.ones_like(a)], axis=-1),
+                  np.stack([-det, d], axis=-1)], axis=-2)
+    return y / b[..., None, None]
+
@@ -0,0 +1,180 @@
+import json
+import os
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Dict, Final, Iterator, Tuple, Optional
+
+import numpy as np
+import numpy.linalg as la
+
+from exercise_1.analytic import A_z, H_phi
+from exercise_1.constants import l_z, WIRE, SHELL
+from exercise_1.mssolution import MSSolution
+
+ChunkSize: Final[int] = 1 << 20
+"""The default number of rows per chunk."""
+
+
+@dataclass
+class ChunkedArray:
+    """An array stored as '.npy' chunks of rows in a directory. Chunks are memory-mapped on access.
+
+    path: The directory of the chunks.
+    shape: The shape of the full array.
+    chunk_size: The number of rows per chunk.
+    """
+
+    path: str
+    shape: Tuple[int, ...]
+    chunk_size: int
+
+    @property
+    def num_chunks(self) -> int:
+        """The number of chunks."""
+        return max(1, -(-self.shape[0] // self.chunk_size))
+
+    def chunk(self, i: int) -> np.ndarray:
+        """The memory-mapped i-th chunk."""
+        return np.load(os.path.join(self.path, f"{i}.npy"), mmap_mode='r')
+
+    def chunks(self) -> Iterator[Tuple[slice, np.ndarray]]:
+        """Iterates over the chunks. Yields the row slice and the memory-mapped chunk."""
+        for i in range(self.num_chunks):
+            yield slice(i * self.chunk_size, min((i + 1) * self.chunk_size, self.shape[0])), self.chunk(i)
+
+    def read(self) -> np.ndarray:
+        """Reads the full array into memory."""
+        return np.concatenate([c for _, c in self.chunks()])
+
+    @staticmethod
+    def write(path: str, array: np.ndarray, chunk_size: int = ChunkSize):
+        """Writes the array in chunks of rows to the directory path."""
+        os.makedirs(path, exist_ok=True)
+        array = np.asarray(array)
+        stored = ChunkedArray(path, array.shape, chunk_size)
+        for i in range(stored.num_chunks):
+            np.save(os.path.join(path, f"{i}.npy"), array[i * chunk_size:(i + 1) * chunk_size])
+        return stored
+
+
+@dataclass
+class SolutionStore:
+    """A persistent magneto-static solution. A directory with a 'meta.json' file and chunked arrays.
+
+    Arrays: 'node_coords' (N,2), 'elems' (E,3), 'A_z' (N), 'r_elem' (E), 'reluctivity' (E) and 'B' (E,2).
+    'A_z' is the vector potential per length l_z, 'r_elem' the radius of the element centroids.
+    The geometry and the permeabilities are stored as keyword arguments of the analytic solution 'analytic.A_z'.
+    They are None if the wire or the shell has no material, as the analytic solution does not apply then.
+    """
+
+    path: str
+
+    @cached_property
+    def meta(self) -> Dict:
+        """The meta data. The mesh reference, scalar outputs and array layouts."""
+        with open(os.path.join(self.path, "meta.json")) as file:
+            return json.load(file)
+
+    @property
+    def mesh(self) -> Optional[str]:
+        """The reference of the mesh the solution was computed on."""
+        return self.meta["mesh"]
+
+    @property
+    def geometry(self) -> Optional[Dict[str, float]]:
+        """The geometry and permeabilities of the cable. Keyword arguments of 'analytic.A_z'."""
+        return self.meta["geometry"]
+
+    @property
+    def scalars(self) -> Dict[str, float]:
+        """The scalar outputs."""
+        return self.meta["scalars"]
+
+    def __getitem__(self, name: str) -> ChunkedArray:
+        """The stored array with the given name."""
+        layout = self.meta["arrays"][name]
+        return ChunkedArray(os.path.join(self.path, name), tuple(layout["shape"]), layout["chunk_size"])
+
+    @staticmethod
+    def save(path: str, solution: MSSolution, mesh: str = None, scalars: Dict[str, float] = None,
+             chunk_size: int = ChunkSize):
+        """Saves a solved magneto-static solution.
+
+        :param path: The directory of the store.
+        :param solution: The solution. 'solve' must have been called.
+        :param mesh: A reference of the mesh, e.g. the file name or job name.
+        :param scalars: The scalar outputs.
+        :param chunk_size: The number of rows per chunk.
+        """
+
+        m = solution.mesh
+        geo = solution.geo
+        geometry = None
+        if WIRE in geo.materials and SHELL in geo.materials:
+            geometry = dict(r_wire=geo.r_wire, r_shell=geo.r_shell,
+                            mu_wire=geo.materials[WIRE].mu, mu_shell=geo.materials[SHELL].mu)
+        arrays = dict(
+            node_coords=m.node_coords,
+            elems=m.elems,
+            A_z=solution.a / l_z,
+            r_elem=la.norm(np.mean(m.node_coords[m.elems], axis=1), axis=1),
+            reluctivity=solution.geo.reluctivity,
+            B=solution.b,
+        )
+
+        os.makedirs(path, exist_ok=True)
+        layouts = {}
+        for name, array in arrays.items():
+            stored = ChunkedArray.write(os.path.join(path, name), array, chunk_size)
+            layouts[name] = dict(shape=list(stored.shape), chunk_size=chunk_size)
+
+        with open(os.path.join(path, "meta.json"), "w") as file:
+            json.dump(dict(mesh=mesh, geometry=geometry, scalars=scalars or {}, arrays=layouts), file, indent=2)
+        return SolutionStore(path)
+
+
+def zip_chunks(*arrays: ChunkedArray) -> Iterator[Tuple[np.ndarray, ...]]:
+    """Iterates over the chunks of arrays with the same number of rows and chunk size."""
+    for i in range(arrays[0].num_chunks):
+        yield tuple(np.asarray(a.chunk(i)) for a in arrays)
+
+
+def rel_error(pairs: Iterator[Tuple[np.ndarray, np.ndarray]]) -> float:
+    """The relative discrete L2 error of values against reference values, accumulated chunk by chunk.
+
+    :param pairs: The chunks of values and reference values.
+    """
+
+    err = 0
+    norm = 0
+    for v, ref in pairs:
+        err += np.sum((v - ref) ** 2)
+        norm += np.sum(ref ** 2)
+    return float(np.sqrt(err / norm))
+
+
+def error_A_z(store: SolutionStore) -> float:
+    """The relative error of the stored vector potential against the analytic solution 'A_z' of the stored geometry.
+
+    :raises ValueError: If the store has no analytic geometry.
+    """
+    return rel_error((a, A_z(la.norm(coords, axis=1), **_geometry(store)))
+                     for a, coords in zip_chunks(store["A_z"], store["node_coords"]))
+
+
+def error_B(store: SolutionStore) -> float:
+    """The relative error of the stored flux density magnitude against the analytic solution 'H_phi'
+    of the stored geometry. Elements without material, i.e. with zero reluctivity, are skipped.
+
+    :raises ValueError: If the store has no analytic geometry.
+    """
+    r_wire = _geometry(store)["r_wire"]
+    return rel_error((la.norm(b[nu > 0], axis=1), H_phi(r[nu > 0], r_wire) / nu[nu > 0])
+                     for b, r, nu in zip_chunks(store["B"], store["r_elem"], store["reluctivity"]))
+
+
+def _geometry(store: SolutionStore) -> Dict[str, float]:
+    """The analytic geometry of the store."""
+    if store.geometry is None:
+        raise ValueError(f"The store '{store.path}' has no wire and shell materials to compare against.")
+    return store.geometry
@@ -0,0 +1,65 @@
+import sys
+from collections import Counter
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from exercise_1.constants import r1, r2, GND, WIRE, SHELL
+from exercise_1.geometry import Geo
+from exercise_1.mesh import Mesh
+
+
+def annulus_mesh(num_phi: int = 48, num_wire: int = 6, num_shell: int = 6) -> Mesh:
+    """A structured mesh of the coaxial cable cross-section, created without gmsh.
+
+    :param num_phi: The number of nodes per ring.
+    :param num_wire: The number of rings in the wire, the last one at r1.
+    :param num_shell: The number of rings in the shell, the last one at r2.
+    """
+
+    radii = np.r_[np.linspace(0, r1, num_wire + 1)[1:], np.linspace(r1, r2, num_shell + 1)[1:]]
+    phi = np.linspace(0, 2 * np.pi, num_phi, endpoint=False)
+    coords = np.r_[[[0, 0]], np.reshape([[r * np.cos(phi), r * np.sin(phi)] for r in radii], (-1, 2, num_phi))
+                   .transpose(0, 2, 1).reshape(-1, 2)]
+
+    def ring(k: int) -> np.ndarray:
+        return 1 + k * num_phi + np.arange(num_phi)
+
+    i = np.arange(num_phi)
+    j = (i + 1) % num_phi
+    elems = [np.c_[np.zeros(num_phi, dtype=int), ring(0)[i], ring(0)[j]]]
+    for k in range(len(radii) - 1):
+        inner, outer = ring(k), ring(k + 1)
+        elems += [np.c_[inner[i], outer[i], outer[j]], np.c_[inner[i], outer[j], inner[j]]]
+    elems = np.concatenate(elems)
+
+    num_node = len(coords)
+    r = np.linalg.norm(coords, axis=1)
+    groups = np.zeros((num_node, 3))
+    groups[np.isclose(r, r2), GND] = 1
+    groups[r <= r1 * (1 + 1e-9), WIRE] = 1
+    groups[r >= r1 * (1 - 1e-9), SHELL] = 1
+
+    return Mesh(np.arange(1, num_node + 1), np.c_[coords, np.zeros(num_node)].ravel(), np.array([2]),
+                [np.arange(len(elems))], [elems.ravel() + 1], groups)
+
+
+@pytest.fixture
+def mesh() -> Mesh:
+    return annulus_mesh()
+
+
+@pytest.fixture
+def geo(mesh: Mesh) -> Geo:
+    return Geo(mesh)
+
+
+@pytest.fixture
+def meshing(monkeypatch) -> Counter:
+    """Replaces gmsh, 'coax_cable.cable' and 'Mesh.create' by the annulus mesh. Counts the calls."""
+    calls = Counter()
+    monkeypatch.setitem(sys.modules, "gmsh", SimpleNamespace(finalize=lambda: calls.update(["finalize"])))
+    monkeypatch.setattr("exercise_1.coax_cable.cable", lambda **kwargs: calls.update(["cable"]))
+    monkeypatch.setattr(Mesh, "create", staticmethod(lambda: annulus_mesh()))
+    return calls
@@ -0,0 +1,86 @@
+import json
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+import pytest
+
+from exercise_1.batch import Job, main, execute, EXIT_OK, EXIT_FAILED, EXIT_CONFIG
+from exercise_1.mesh import Mesh
+
+
+def test_job_defaults():
+    job = Job.of(dict(name="coax", frequencies=dict(start=0, stop=2, num=3)))
+    assert job.frequencies == pytest.approx([1, 10, 100])
+    assert job.ordering is None
+
+
+@pytest.mark.parametrize("config", [
+    dict(),
+    dict(name=""),
+    dict(name="../x"),
+    dict(name="a\\b"),
+    dict(name=".."),
+    dict(name="coax", foo=1),
+    dict(name="coax", ordering="foo"),
+    dict(name="coax", mesh_size="big"),
+    dict(name="coax", mesh_size=0),
+    dict(name="coax", outputs="L"),
+    dict(name="coax", outputs=["foo"]),
+    dict(name="coax", outputs=["Z_char"]),
+    dict(name="coax", frequencies=dict(begin=0)),
+    dict(name="coax", frequencies=["1"]),
+    dict(name="coax", geometry=dict(r1=2e-3, r2=1e-3)),
+    dict(name="coax", materials=dict(mu_w="1")),
+])
+def test_invalid_job(config):
+    with pytest.raises(ValueError):
+        Job.of(config)
+
+
+def test_invalid_job_exit_code(tmp_path):
+    path = tmp_path / "job.json"
+    path.write_text(json.dumps(dict(name="coax", ordering="foo")))
+    assert main([str(path), "-o", str(tmp_path)]) == EXIT_CONFIG
+
+
+def test_duplicate_names_exit_code(tmp_path):
+    path = tmp_path / "job.json"
+    path.write_text(json.dumps(dict(name="coax")))
+    assert main([str(path), str(path), "-o", str(tmp_path)]) == EXIT_CONFIG
+
+
+def test_main(meshing, tmp_path):
+    path = tmp_path / "job.json"
+    path.write_text(json.dumps(dict(name="coax", outputs=["W_mag", "L", "C", "R", "Z_char", "A_z"],
+                                    frequencies=[1e3, 1e6])))
+    out = tmp_path / "results"
+    assert main([str(path), "-o", str(out)]) == EXIT_OK
+    assert meshing == {"cable": 1, "finalize": 1}
+
+    results = json.loads((out / "coax.json").read_text())
+    assert results["job"]["name"] == "coax"
+    assert set(results["results"]) == {"num_node", "num_elems", "W_mag", "L", "C", "R"}
+    assert results["results"]["L"] > 0
+    arrays = np.load(out / "coax.npz")
+    assert set(arrays.files) == {"f", "Z_char", "A_z"}
+    assert np.array_equal(arrays["f"], [1e3, 1e6])
+    assert arrays["A_z"].shape == (results["results"]["num_node"],)
+
+
+def test_gmsh_finalized_on_error(meshing, monkeypatch, tmp_path):
+    def _fail():
+        raise RuntimeError("meshing failed")
+
+    monkeypatch.setattr(Mesh, "create", staticmethod(_fail))
+    assert "meshing failed" in execute(Job(name="coax"), str(tmp_path))
+    assert meshing["finalize"] == 1
+
+
+def test_broken_pool_exit_code(monkeypatch, tmp_path):
+    def _broken(*args, **kwargs):
+        raise BrokenProcessPool("worker killed")
+
+    monkeypatch.setattr("exercise_1.batch.ProcessPoolExecutor", _broken)
+    path = tmp_path / "job.json"
+    path.write_text(json.dumps([dict(name="a"), dict(name="b")]))
+    assert main([str(path), "-o", str(tmp_path), "--jobs", "2"]) == EXIT_FAILED
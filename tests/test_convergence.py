@@ -0,0 +1,32 @@
+from dataclasses import replace
+
+import pytest
+
+from exercise_1.convergence import level_of, check
+from exercise_1.geometry import Geo
+from exercise_1.mssolution import MSSolution
+from conftest import annulus_mesh
+
+
+@pytest.fixture(scope="module")
+def levels():
+    levels = []
+    for k in range(3):
+        mesh = annulus_mesh(num_phi=24 * 2 ** k, num_wire=3 * 2 ** k, num_shell=3 * 2 ** k)
+        solution = MSSolution(mesh, Geo(mesh))
+        solution.solve()
+        levels.append(level_of(solution, mesh_size=2.0 ** -k))
+    return levels
+
+
+def test_rates(levels):
+    report = check(levels)
+    assert report["rates"] == pytest.approx({"A_z": 2, "B": 1, "energy": 1}, abs=0.1)
+    assert report["passed"]
+
+
+def test_failed(levels):
+    finest = levels[-1]
+    assert not check(levels[:-1] + [replace(finest, err_A_z=10 * finest.err_A_z)])["passed"]
+    assert not check(levels[:-1] + [replace(finest, err_W=0.1)])["passed"]
+    assert not check(levels[:-1] + [replace(finest, err_knu=0.1)])["passed"]
@@ -0,0 +1,46 @@
+from dataclasses import replace
+
+import numpy as np
+
+from exercise_1.constants import I, WIRE, SHELL
+from exercise_1.material import Material, Insulator
+from exercise_1.mssolution import MSSolution
+
+
+def test_set_material_updates_group_only(geo):
+    reluctivity = geo.reluctivity
+    expected = reluctivity.copy()
+    shell = geo.mesh.elem_in_group(SHELL)
+    expected[shell] = 1 / (2 * Insulator.mu)
+
+    geo.set_material(SHELL, replace(Insulator, mu=2 * Insulator.mu))
+    assert np.array_equal(geo.reluctivity, expected)
+    assert np.array_equal(reluctivity[~shell], expected[~shell])
+    assert np.all(reluctivity[shell] == 1 / Insulator.mu)  # Returned vectors are not modified
+
+
+def test_solution_set_material(geo):
+    solution = MSSolution(geo.mesh, geo)
+    solution.solve()
+    C, L, R = solution.C, solution.L, solution.R
+
+    solution.set_material(SHELL, replace(Insulator, eps=2 * Insulator.eps))
+    assert np.isclose(solution.C, 2 * C, rtol=1e-10)
+    assert solution.L == L
+
+    solution.set_material(WIRE, replace(geo.materials[WIRE], sigma=geo.materials[WIRE].sigma / 2))
+    assert np.isclose(solution.R, 2 * R)
+
+    solution.set_material(SHELL, replace(geo.materials[SHELL], mu=geo.materials[SHELL].mu / 2))
+    assert np.all(solution.a == 0)
+    assert solution.L < L
+    solution.solve()
+    assert np.isclose(0.5 * solution.a @ (solution.knu @ solution.a), solution.L * I ** 2 / 2, rtol=1e-8)
+
+
+def test_material_with_bh_curve():
+    curve = (np.array([0, 1, 2]), np.array([0, 100, 400]))
+    a = Material(mu=1e-2, bh_curve=curve)
+    b = Material(mu=1e-2, bh_curve=curve)
+    assert a == b and hash(a) == hash(b)
+    assert np.allclose(a.nu([0, 1, 2]), [100, 100, 200])
@@ -0,0 +1,15 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+Root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.mark.parametrize("module", ["exercise_1.analytic", "exercise_1.mesh", "exercise_1.mssolution",
+                                    "exercise_1.batch"])
+def test_no_heavy_imports(module):
+    check = f"import sys, {module}; print(','.join(m for m in ('gmsh', 'matplotlib') if m in sys.modules))"
+    out = subprocess.run([sys.executable, "-c", check], cwd=Root, check=True, capture_output=True, text=True).stdout
+    assert out.strip() == ""
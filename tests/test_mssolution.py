@@ -0,0 +1,25 @@
+import numpy as np
+
+from exercise_1 import analytic
+from exercise_1.knu_matrix import Knu_e
+from exercise_1.mssolution import MSSolution
+
+
+def test_knu_local_matrices(geo):
+    knu = MSSolution(geo.mesh, geo).knu
+    elems = geo.mesh.elems
+    expected = np.zeros(knu.shape)
+    for e in range(geo.mesh.num_elems):
+        expected[np.ix_(elems[e], elems[e])] += Knu_e(e, geo.mesh, geo)
+    assert np.allclose(knu.toarray(), expected, rtol=0, atol=1e-12 * np.abs(expected).max())
+
+
+def test_capacitance(geo):
+    assert np.isclose(MSSolution(geo.mesh, geo).C, analytic.C(), rtol=1e-2)
+
+
+def test_inductance(geo):
+    solution = MSSolution(geo.mesh, geo)
+    a = solution.solve().copy()
+    assert np.isclose(solution.L, analytic.L(), rtol=1e-2)
+    assert np.array_equal(solution.a, a)
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from exercise_1 import network
+from exercise_1.batch import Job
+from exercise_1.network import CrossSection, Section, abcd, admittance, cross_section
+
+cable = CrossSection(R=1.4e-3, L=2.5e-7, C=1.1e-10)
+other = CrossSection(R=5.6e-3, L=3.1e-7, C=0.9e-10)
+f = np.logspace(0, 8, 50)
+
+
+def test_single_section():
+    beta, z = cable.propagation(f)
+    bl = beta * 0.3
+    chain = abcd([Section(cable, 0.3)], f)
+    assert np.allclose(chain[:, 0, 0], np.cosh(bl))
+    assert np.allclose(chain[:, 0, 1], -z * np.sinh(bl))
+    assert np.allclose(chain[:, 1, 0], -np.sinh(bl) / z)
+    assert np.allclose(chain[:, 1, 1], np.cosh(bl))
+
+    y = admittance(chain)
+    expected = np.array([[np.cosh(bl), -np.ones_like(bl)], [np.ones_like(bl), -np.cosh(bl)]]) / (z * np.sinh(bl))
+    assert np.allclose(y, np.moveaxis(expected, -1, 0))
+
+
+def test_split_section():
+    assert np.allclose(abcd([Section(cable, 0.1), Section(cable, 0.2)], f), abcd([Section(cable, 0.3)], f))
+
+
+@pytest.mark.parametrize("block_size", [1, 150, 1 << 16])
+def test_cascade_order(monkeypatch, block_size):
+    monkeypatch.setattr(network, "BlockSize", block_size)
+    sections = [Section([cable, other][i % 3 == 0], 0.1 + 0.01 * i) for i in range(7)]
+    expected = np.broadcast_to(np.eye(2), (len(f), 2, 2))
+    for s in sections:
+        expected = abcd([s], f) @ expected
+    assert np.allclose(abcd(sections, f), expected)
+
+
+def test_admittance_of_cascade():
+    chain = abcd([Section(cable, 0.2), Section(other, 0.5)], f)
+    u0, i0 = 1, 0.3
+    ul, il = (chain @ np.array([u0, i0])).T
+    currents = admittance(chain) @ np.stack([np.full(len(f), u0), ul], axis=-1)[..., None]
+    assert np.allclose(currents[:, 0, 0], i0)
+    assert np.allclose(currents[:, 1, 0], il)
+
+
+def test_cross_section_cache(meshing, monkeypatch):
+    monkeypatch.setattr(network, "_cache", {})
+    cs = cross_section(Job(name="a"))
+    assert cross_section(Job(name="b", ordering="nd", outputs=["R"], frequencies=[1e3])) is cs
+    assert meshing["cable"] == 1
+    assert cross_section(Job(name="c", mesh_size=0.4)) is not cs
+    assert meshing["cable"] == 2
+    assert cs.L > 0 and cs.C > 0 and cs.R > 0
@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+from exercise_1.mssolution import MSSolution
+from exercise_1.reordering import Orderings, permutation, permute, bandwidth, fill_in
+
+
+@pytest.mark.parametrize("ordering", Orderings)
+def test_permutation(geo, ordering):
+    A = MSSolution(geo.mesh, geo).knu_dof
+    perm = permutation(A, ordering)
+    assert np.array_equal(np.sort(perm), np.arange(A.shape[0]))
+
+
+@pytest.mark.parametrize("ordering", Orderings)
+def test_solution_in_original_order(geo, ordering):
+    a = MSSolution(geo.mesh, geo).solve()
+    a_perm = MSSolution(geo.mesh, geo, ordering=ordering).solve()
+    assert np.allclose(a_perm, a, rtol=1e-10, atol=0)
+
+
+def test_rcm_bandwidth(geo):
+    A = MSSolution(geo.mesh, geo).knu_dof
+    shuffled = permute(A, np.random.default_rng(0).permutation(A.shape[0]))
+    assert bandwidth(permute(shuffled, permutation(shuffled, "rcm"))) < bandwidth(shuffled)
+
+
+def test_ordering_stats(geo):
+    solution = MSSolution(geo.mesh, geo, ordering="nd")
+    before, after = solution.ordering_stats
+    # Nested dissection reduces the fill-in of the annulus mesh below both the natural order and COLAMD
+    assert after.fill_in < fill_in(solution.knu_dof, "NATURAL")
+    assert after.fill_in < before.fill_in
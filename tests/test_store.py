@@ -0,0 +1,59 @@
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from exercise_1.constants import WIRE, SHELL
+from exercise_1.geometry import Geo
+from exercise_1.material import Copper, Insulator
+from exercise_1.mssolution import MSSolution
+from exercise_1.store import SolutionStore, ChunkedArray, error_A_z, error_B
+
+
+def test_round_trip(geo, tmp_path):
+    solution = MSSolution(geo.mesh, geo)
+    solution.solve()
+    SolutionStore.save(str(tmp_path), solution, mesh="annulus", scalars=dict(L=solution.L), chunk_size=100)
+
+    store = SolutionStore(str(tmp_path))
+    assert store.mesh == "annulus"
+    assert store.scalars["L"] == solution.L
+    assert store["A_z"].num_chunks > 1
+    assert np.array_equal(store["B"].read(), solution.b)
+    assert np.array_equal(store["elems"].read(), geo.mesh.elems)
+
+
+def test_errors_of_stored_geometry(mesh, tmp_path):
+    geo = Geo(mesh, materials={WIRE: replace(Copper, mu=2 * Copper.mu), SHELL: replace(Insulator, mu=Insulator.mu / 3)})
+    solution = MSSolution(mesh, geo)
+    solution.solve()
+    store = SolutionStore.save(str(tmp_path), solution, chunk_size=100)
+
+    assert error_A_z(store) < 1e-2
+    assert error_B(store) < 1e-1
+
+
+def test_elements_without_material(geo, tmp_path):
+    solution = MSSolution(geo.mesh, geo)
+    solution.solve()
+    store = SolutionStore.save(str(tmp_path), solution, chunk_size=100)
+    err = error_B(store)
+
+    reluctivity = store["reluctivity"].read()
+    reluctivity[::7] = 0
+    ChunkedArray.write(store["reluctivity"].path, reluctivity, chunk_size=100)
+    assert np.isfinite(error_B(store))
+    assert error_B(store) == pytest.approx(err, rel=0.5)
+
+
+def test_no_analytic_geometry(geo, tmp_path):
+    solution = MSSolution(geo.mesh, geo)
+    solution.solve()
+    solution.geo = Geo(geo.mesh, materials={WIRE: Copper})
+    store = SolutionStore.save(str(tmp_path), solution)
+
+    assert store.geometry is None
+    with pytest.raises(ValueError):
+        error_A_z(store)
+    with pytest.raises(ValueError):
+        error_B(store)
@@ -2,8 +2,6 @@ import sys
 from functools import wraps
 from typing import Dict, Final
 
-import gmsh
-
 DefaultOptions: Final[Dict[str, float]] = {
     # "General.Verbosity": 0,
     "Mesh.MeshSizeFactor": 0.8,
@@ -20,6 +18,7 @@ def model(name: str, dim: int = 3, show_gui: bool = False, finalize: bool = Fals
     :param show_gui: Whether to show the gui.
     :param finalize: Whether to finalize the gmsh API.
     :param options: Options that get passed to 'gmsh.option.set_number'.
+        The decorated function accepts a 'gmsh_options' keyword to override them per call.
     """
 
     if options is None:
@@ -28,10 +27,11 @@ def model(name: str, dim: int = 3, show_gui: bool = False, finalize: bool = Fals
     def _model(func):
 
         @wraps(func)
-        def wrapper(*args, **kwargs):
+        def wrapper(*args, gmsh_options: Dict[str, float] = None, **kwargs):
+            import gmsh
             gmsh.initialize()
 
-            for option, value in options.items():
+            for option, value in {**options, **(gmsh_options or {})}.items():
                 gmsh.option.set_number(option, value)
 
             gmsh.model.add(name)